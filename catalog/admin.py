@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db.models import Prefetch
+
 from .models import Author, Genre, Book, BookInstance
 
 # admin.site.register(Author)
@@ -19,9 +21,23 @@ class BooksInstanceInline(admin.TabularInline):
 
 @admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
-    list_display = ("title", "author", "display_genre")
+    list_display = ("title", "author", "display_genre_cached")
     inlines = [BooksInstanceInline]
 
+    def get_queryset(self, request):
+        """Prefetch genres so display_genre_cached does not query per row."""
+        return (
+            super()
+            .get_queryset(request)
+            .prefetch_related(
+                Prefetch(
+                    "genre",
+                    queryset=Genre.objects.only("id", "name"),
+                    to_attr="_prefetched_genres",
+                )
+            )
+        )
+
 
 @admin.register(BookInstance)
 class BookInstanceAdmin(admin.ModelAdmin):
@@ -1,16 +1,16 @@
-# enum class
-from enum import Enum
+from django.db import models
+from django.utils.translation import gettext_lazy as _
 
 
-class LoanStatus(Enum):
+class LoanStatus(models.TextChoices):
     """
-    Enum representing the status of a loan.
+    Choices representing the status of a loan.
     """
 
-    MAINTENANCE = "m"
-    ON_LOAN = "o"
-    AVAILABLE = "a"
-    RESERVED = "r"
+    MAINTENANCE = "m", _("Maintenance")
+    ON_LOAN = "o", _("On loan")
+    AVAILABLE = "a", _("Available")
+    RESERVED = "r", _("Reserved")
 
 
 # Maximum lengths for CharFields
@@ -26,3 +26,11 @@ BOOKS_PER_PAGE = 5
 # Number of weeks for book renewal
 DEFAULT_RENEWAL_WEEKS = 3
 MAX_RENEWAL_WEEKS = 4
+
+# Cache key and lifetime (seconds) for the home page counts
+INDEX_COUNTS_CACHE_KEY = "catalog:index_counts"
+INDEX_COUNTS_CACHE_TIMEOUT = 60
+
+# Cache alias and lifetime (seconds) for rendered catalog pages
+PAGE_CACHE_ALIAS = "pages"
+PAGE_CACHE_TIMEOUT = 60
@@ -6,6 +6,8 @@ from django.utils.translation import gettext_lazy as _
 
 from catalog.constants import MAX_RENEWAL_WEEKS
 
+_MAX_RENEWAL_DELTA = datetime.timedelta(weeks=MAX_RENEWAL_WEEKS)
+
 
 class RenewBookForm(forms.Form):
     """Form for renewing a book instance."""
@@ -21,11 +23,10 @@ class RenewBookForm(forms.Form):
         and not more than 4 weeks in the future.
         """
         data = self.cleaned_data["renewal_date"]
-        if data < datetime.date.today():
+        today = datetime.date.today()
+        if data < today:
             raise ValidationError(_("Invalid date - renewal in past"))
-        if data > datetime.date.today() + datetime.timedelta(
-            weeks=MAX_RENEWAL_WEEKS
-        ):
+        if data > today + _MAX_RENEWAL_DELTA:
             raise ValidationError(
                 _("Invalid date - renewal " "more than 4 weeks ahead")
             )
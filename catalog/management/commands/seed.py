@@ -1,14 +1,17 @@
 """Django management command to seed the database with test data."""
 
 import random
-import uuid
 
 from django.core.management.base import BaseCommand
+from django.core.management.color import no_style
 from django.contrib.auth.models import User
-from django_seed import Seed
+from django.db import connection, transaction
+from faker import Faker
 
 from catalog.models import Author, Book, Genre, BookInstance
-from catalog.constants import LoanStatus
+from catalog.constants import LoanStatus, MAX_LENGTH_SUMMARY
+
+BOOK_COUNT = 20
 
 
 class Command(BaseCommand):
@@ -20,24 +23,44 @@ class Command(BaseCommand):
         parser.add_argument(
             "--clear", action="store_true", help="Delete all seeded data"
         )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Faker seed; re-running with the same seed adds nothing",
+        )
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         if kwargs["clear"]:
             self.stdout.write("🧹 Clearing seeded data...")
-            BookInstance.objects.all().delete()
-            Book.objects.all().delete()
-            Author.objects.all().delete()
-            Genre.objects.all().delete()
+            self._clear_catalog()
             self.stdout.write(self.style.SUCCESS("✅ All seeded data deleted."))
             return
 
-        seeder = Seed.seeder()
-
-        # Clear existing data if needed
-        Genre.objects.all().delete()
-        Author.objects.all().delete()
-        Book.objects.all().delete()
-        BookInstance.objects.all().delete()
+        fake = Faker()
+        # A fixed Faker seed makes every run generate the same ISBNs, so
+        # books that are already present can be recognised and skipped.
+        fake.seed_instance(kwargs["seed"])
+
+        # Generate books first so the Faker call order is stable
+        books = [
+            Book(
+                title=fake.sentence(nb_words=4),
+                summary=fake.text(max_nb_chars=MAX_LENGTH_SUMMARY),
+                isbn=fake.isbn13(separator=""),
+            )
+            for _ in range(BOOK_COUNT)
+        ]
+        existing_isbns = set(
+            Book.objects.filter(
+                isbn__in=[book.isbn for book in books]
+            ).values_list("isbn", flat=True)
+        )
+        books = [book for book in books if book.isbn not in existing_isbns]
+        if not books:
+            self.stdout.write(self.style.SUCCESS("✅ Database already seeded."))
+            return
 
         # Seed genres
         genre_names = [
@@ -47,74 +70,129 @@ class Command(BaseCommand):
             "Romance",
             "Non-Fiction",
         ]
-        genres = [Genre.objects.create(name=name) for name in genre_names]
+        existing_genres = set(
+            Genre.objects.filter(name__in=genre_names).values_list(
+                "name", flat=True
+            )
+        )
+        Genre.objects.bulk_create(
+            [
+                Genre(name=name)
+                for name in genre_names
+                if name not in existing_genres
+            ]
+        )
+        genres = list(Genre.objects.filter(name__in=genre_names))
 
         # Seed authors
-        seeder.add_entity(
-            Author,
-            10,
-            {
-                "first_name": lambda x: seeder.faker.first_name(),
-                "last_name": lambda x: seeder.faker.last_name(),
-                "date_of_birth": lambda x: seeder.faker.date_of_birth(
-                    minimum_age=30, maximum_age=80
-                ),
-                "date_of_death": lambda x: None,
-            },
+        Author.objects.bulk_create(
+            [
+                Author(
+                    first_name=fake.first_name(),
+                    last_name=fake.last_name(),
+                    date_of_birth=fake.date_of_birth(
+                        minimum_age=30, maximum_age=80
+                    ),
+                )
+                for _ in range(10)
+            ]
         )
-
-        inserted_pks = seeder.execute()
         authors = Author.objects.all()
 
         # Get existing users or create some test users
         users = list(User.objects.all())
         if users.__len__() <= 5:
-            # Create some test users if none exist
-            for i in range(5):
+            # Create the test users that do not exist yet
+            usernames = [f"testuser{i+1}" for i in range(5)]
+            existing_usernames = set(
+                User.objects.filter(username__in=usernames).values_list(
+                    "username", flat=True
+                )
+            )
+            for username in usernames:
+                if username in existing_usernames:
+                    continue
                 user = User.objects.create_user(
-                    username=f"testuser{i+1}",
-                    email=f"testuser{i+1}@example.com",
+                    username=username,
+                    email=f"{username}@example.com",
                     password="testpass123",
                 )
                 users.append(user)
 
-        # Seed books manually to set M2M and FK
-        books = []
-        for _ in range(20):
-            book = Book.objects.create(
-                title=seeder.faker.sentence(nb_words=4),
-                summary=seeder.faker.text(max_nb_chars=200),
-                isbn=seeder.faker.isbn13(separator=""),
-                author=random.choice(authors),
-            )
-            # Assign 1–3 genres
-            book.genre.set(random.sample(genres, k=random.randint(1, 3)))
-            books.append(book)
+        self._seed_books(fake, books, list(authors), genres, users)
+
+        self.stdout.write(
+            self.style.SUCCESS("🎉 Database seeded successfully!")
+        )
+
+    def _clear_catalog(self):
+        """
+        Empty all catalog tables in one flush.
+
+        Uses the backend's flush SQL (TRUNCATE ... CASCADE on PostgreSQL,
+        TRUNCATE on MySQL, DELETE on SQLite) instead of collecting and
+        deleting every row through the ORM.
+        """
+        tables = [
+            BookInstance._meta.db_table,
+            Book.genre.through._meta.db_table,
+            Book._meta.db_table,
+            Author._meta.db_table,
+            Genre._meta.db_table,
+        ]
+        sql_list = connection.ops.sql_flush(
+            no_style(), tables, reset_sequences=True, allow_cascade=True
+        )
+        connection.ops.execute_sql_flush(sql_list)
+
+    def _seed_books(self, fake, books, authors, genres, users):
+        """Bulk-insert new books, their genres and their copies."""
+        # Draw random picks in batches rather than once per row
+        book_authors = random.choices(authors, k=len(books))
+        for book, author in zip(books, book_authors):
+            book.author = author
+        Book.objects.bulk_create(books, batch_size=500, ignore_conflicts=True)
+        # Primary keys are not set on objects inserted with ignore_conflicts
+        books = list(
+            Book.objects.filter(isbn__in=[book.isbn for book in books])
+        )
+
+        # Assign 1–3 genres with one multi-row INSERT on the through table
+        book_genre = Book.genre.through
+        book_genre.objects.bulk_create(
+            [
+                book_genre(book_id=book.pk, genre_id=genre.pk)
+                for book in books
+                for genre in random.sample(genres, k=random.randint(1, 3))
+            ],
+            ignore_conflicts=True,
+        )
 
         # Seed book instances
-        for book in books:
-            for _ in range(random.randint(1, 5)):  # 1–5 copies
-                status = random.choice([status.value for status in LoanStatus])
+        copies = random.choices(range(1, 6), k=len(books))  # 1–5 copies
+        statuses = iter(random.choices(LoanStatus.values, k=sum(copies)))
+        instances = []
+        for book, copy_count in zip(books, copies):
+            for _ in range(copy_count):
+                status = next(statuses)
 
                 # Only assign borrower if the book is on loan
                 borrower = None
                 due_back = None
 
-                if status == LoanStatus.ON_LOAN.value:
+                if status == LoanStatus.ON_LOAN:
                     borrower = random.choice(users)
-                    due_back = seeder.faker.date_between(
+                    due_back = fake.date_between(
                         start_date="today", end_date="+30d"
                     )
 
-                BookInstance.objects.create(
-                    id=uuid.uuid4(),
-                    book=book,
-                    imprint=seeder.faker.company(),
-                    due_back=due_back,
-                    borrower=borrower,
-                    status=status,
+                instances.append(
+                    BookInstance(
+                        book=book,
+                        imprint=fake.company(),
+                        due_back=due_back,
+                        borrower=borrower,
+                        status=status,
+                    )
                 )
-
-        self.stdout.write(
-            self.style.SUCCESS("🎉 Database seeded successfully!")
-        )
+        BookInstance.objects.bulk_create(instances, batch_size=1000)
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0006_alter_bookinstance_options_alter_bookinstance_id"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bookinstance",
+            name="due_back",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="bookinstance",
+            index=models.Index(
+                fields=["status", "due_back"], name="bi_status_due_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:50
+
+from django.db import migrations, models
+from django.db.models.functions import Length, Substr
+
+
+def truncate_summaries(apps, schema_editor):
+    """Cut existing summaries to the new 100 character limit."""
+    Book = apps.get_model("catalog", "Book")
+    Book.objects.annotate(summary_length=Length("summary")).filter(
+        summary_length__gt=100
+    ).update(summary=Substr("summary", 1, 100))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0007_bookinstance_status_due_back_indexes"),
+    ]
+
+    operations = [
+        # Summaries used to allow up to 1000 characters
+        migrations.RunPython(truncate_summaries, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="book",
+            name="summary",
+            field=models.CharField(
+                help_text="Enter a brief description of the book",
+                max_length=100,
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:50
+
+import catalog.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0008_alter_book_summary"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bookinstance",
+            name="id",
+            field=models.UUIDField(
+                default=catalog.models.uuid7,
+                help_text="Unique ID for this particular"
+                " book across whole library",
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0009_alter_bookinstance_id_uuid7"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bookinstance",
+            name="status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("m", "Maintenance"),
+                    ("o", "On loan"),
+                    ("a", "Available"),
+                    ("r", "Reserved"),
+                ],
+                default="m",
+                help_text="Book availability",
+                max_length=1,
+            ),
+        ),
+    ]
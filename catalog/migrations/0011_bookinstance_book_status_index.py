@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0010_alter_bookinstance_status_choices"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bookinstance",
+            index=models.Index(
+                fields=["book", "status"], name="bi_book_status_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-15 10:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0012_book_title_id_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bookinstance",
+            index=models.Index(
+                fields=["borrower", "status", "due_back"],
+                name="bi_borrower_status_due_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="bookinstance",
+            name="book",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.RESTRICT,
+                to="catalog.book",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="bookinstance",
+            name="borrower",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -1,5 +1,7 @@
 """catalog/models.py"""
 
+import os
+import time
 import uuid  # Required for unique book instances
 from datetime import date  # Used for date fields
 
@@ -7,6 +9,7 @@ from django.db import models
 
 # Used to generate URLs by reversing the URL patterns
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.models import User
 
@@ -20,6 +23,23 @@ from .constants import (
 )
 
 
+def uuid7():
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The 48-bit millisecond timestamp leads, so new keys land at the end
+    of the primary-key index instead of at random positions.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # variant
+    value |= rand & ((1 << 62) - 1)  # rand_b
+    return uuid.UUID(int=value)
+
+
 class Genre(models.Model):
     """
     Model representing a book genre (e.g. Science Fiction, Non Fiction).
@@ -53,7 +73,7 @@ class Book(models.Model):
     # DO_NOTHING: do nothing (can raise DB integrity errors)
     author = models.ForeignKey("Author", on_delete=models.SET_NULL, null=True)
 
-    summary = models.TextField(
+    summary = models.CharField(
         max_length=MAX_LENGTH_SUMMARY,
         help_text=_("Enter a brief description of the book"),
     )
@@ -70,6 +90,12 @@ class Book(models.Model):
         Genre, help_text=_("Select a genre for this book")
     )
 
+    class Meta:
+        indexes = [
+            # Serves the book list's keyset pagination on (title, id)
+            models.Index(fields=["title", "id"], name="book_title_id_idx"),
+        ]
+
     def __str__(self):
         """
         String for representing the Model object (in Admin site etc.)
@@ -86,11 +112,58 @@ class Book(models.Model):
         """
         Creates a string for the Genre.
         This is required to display genre in Admin.
+
+        Uses the genres prefetched into ``_prefetched_genres`` when
+        available (see ``BookAdmin.get_queryset``) to avoid one query
+        per book.
         """
-        return ", ".join(genre.name for genre in self.genre.all()[:3])
+        genres = getattr(self, "_prefetched_genres", None)
+        if genres is None:
+            genres = self.genre.all()[:3]
+        return ", ".join(genre.name for genre in genres[:3])
 
     display_genre.short_description = "Genre"
 
+    @cached_property
+    def display_genre_cached(self):
+        """
+        display_genre() memoized on the instance, for repeated rendering
+        (e.g. the admin changelist).
+        """
+        return self.display_genre()
+
+    display_genre_cached.short_description = "Genre"
+
+
+class BookInstanceQuerySet(models.QuerySet):
+    """
+    Custom QuerySet for BookInstance with opt-in query helpers.
+    """
+
+    def with_related(self):
+        """
+        Joins the book, its author and the borrower in the same query.
+        """
+        return self.select_related("book", "book__author", "borrower")
+
+    def list_fields(self):
+        """
+        Restricts the columns to those shown in instance listings.
+        """
+        return self.only("id", "book", "status", "due_back", "borrower")
+
+    def with_overdue(self):
+        """
+        Annotates each instance with an ``overdue`` flag computed in SQL.
+        """
+        return self.annotate(
+            overdue=models.Case(
+                models.When(due_back__lt=date.today(), then=models.Value(True)),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            )
+        )
+
 
 class BookInstance(models.Model):
     """
@@ -100,7 +173,7 @@ class BookInstance(models.Model):
 
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         help_text=_("Unique ID for this particular book across whole library"),
     )
 
@@ -111,42 +184,46 @@ class BookInstance(models.Model):
     # SET_NULL: set book to NULL (requires null=True)
     # SET_DEFAULT: set to default value
     # DO_NOTHING: do nothing (can raise DB integrity errors)
-    book = models.ForeignKey("Book", on_delete=models.RESTRICT)
+    book = models.ForeignKey("Book", on_delete=models.RESTRICT, db_index=False)
 
     imprint = models.CharField(max_length=MAX_LENGTH_IMPRINT)
-    due_back = models.DateField(null=True, blank=True)
+    due_back = models.DateField(null=True, blank=True, db_index=True)
 
     borrower = models.ForeignKey(
-        User, on_delete=models.SET_NULL, null=True, blank=True
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,
     )
 
     status = models.CharField(
         max_length=1,
-        choices=[
-            (
-                LoanStatus.MAINTENANCE.value,
-                _(str(LoanStatus.MAINTENANCE.name).capitalize()),
-            ),
-            (
-                LoanStatus.ON_LOAN.value,
-                _(str(LoanStatus.ON_LOAN.name).capitalize()),
-            ),
-            (
-                LoanStatus.AVAILABLE.value,
-                _(str(LoanStatus.AVAILABLE.name).capitalize()),
-            ),
-            (
-                LoanStatus.RESERVED.value,
-                _(str(LoanStatus.RESERVED.name).capitalize()),
-            ),
-        ],
+        choices=LoanStatus.choices,
         blank=True,
-        default=LoanStatus.MAINTENANCE.value,
+        default=LoanStatus.MAINTENANCE,
         help_text=_("Book availability"),
     )
 
+    objects = BookInstanceQuerySet.as_manager()
+
     class Meta:
         ordering = ["due_back"]
+        indexes = [
+            # Serves status filters, optionally ordered by due date
+            models.Index(
+                fields=["status", "due_back"], name="bi_status_due_idx"
+            ),
+            # The next two lead with the book and borrower foreign keys, so
+            # those fields don't get a single-column index of their own.
+            # Serves per-book availability counts (book X, status 'a')
+            models.Index(fields=["book", "status"], name="bi_book_status_idx"),
+            # Serves a borrower's loans, filtered by status, by due date
+            models.Index(
+                fields=["borrower", "status", "due_back"],
+                name="bi_borrower_status_due_idx",
+            ),
+        ]
         permissions = (
             ("can_mark_returned", _("Set book as returned")),
             ("can_renew", _("Renew a book")),
@@ -156,7 +233,10 @@ class BookInstance(models.Model):
     def is_overdue(self):
         """
         Checks if the book instance is overdue.
+        Uses the ``overdue`` annotation from ``with_overdue()`` if present.
         """
+        if "overdue" in self.__dict__:
+            return self.overdue
         return self.due_back and date.today() > self.due_back
 
     def __str__(self):
@@ -0,0 +1,33 @@
+"""catalog/signals.py"""
+
+from django.core.cache import cache, caches
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from catalog.constants import INDEX_COUNTS_CACHE_KEY, PAGE_CACHE_ALIAS
+from catalog.models import Author, Book, BookInstance, Genre
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_save, sender=Book)
+@receiver(post_save, sender=BookInstance)
+@receiver(post_delete, sender=Author)
+@receiver(post_delete, sender=Book)
+@receiver(post_delete, sender=BookInstance)
+def invalidate_index_counts(sender, **kwargs):
+    """Drop the cached home page counts when a counted row changes."""
+    cache.delete(INDEX_COUNTS_CACHE_KEY)
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_save, sender=Book)
+@receiver(post_save, sender=BookInstance)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Author)
+@receiver(post_delete, sender=Book)
+@receiver(post_delete, sender=BookInstance)
+@receiver(post_delete, sender=Genre)
+@receiver(m2m_changed, sender=Book.genre.through)
+def clear_page_cache(sender, **kwargs):
+    """Drop every cached catalog page when catalog data changes."""
+    caches[PAGE_CACHE_ALIAS].clear()
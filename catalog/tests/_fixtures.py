@@ -0,0 +1,65 @@
+"""Shared helpers and fixtures for the catalog tests."""
+
+import datetime
+
+from django.contrib.auth.models import Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.test import TestCase
+
+from catalog.constants import PAGE_CACHE_ALIAS, LoanStatus
+from catalog.models import Author, Book, BookInstance
+
+# Permissions are created by migrations and never change during a run,
+# so they are looked up once per process.
+_PERMISSION_CACHE = {}
+
+
+def get_permission(model, codename):
+    """Return the ``codename`` permission of ``model``."""
+    key = (model, codename)
+    if key not in _PERMISSION_CACHE:
+        content_type = ContentType.objects.get_for_model(model)
+        _PERMISSION_CACHE[key] = Permission.objects.get(
+            codename=codename,
+            content_type=content_type,
+        )
+    return _PERMISSION_CACHE[key]
+
+
+class ClearPageCacheMixin:
+    """Clear the page cache before each test, so none sees an earlier page."""
+
+    def setUp(self):
+        super().setUp()
+        caches[PAGE_CACHE_ALIAS].clear()
+
+
+class CatalogTestCase(ClearPageCacheMixin, TestCase):
+    """
+    Base TestCase creating the author, book, user and book copy that
+    most view tests share. Subclasses extend setUpTestData with the
+    rows they need on top.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(
+            first_name="Test",
+            last_name="Author",
+            date_of_birth=datetime.date(1990, 1, 1),
+        )
+        cls.book = Book.objects.create(
+            title="Test Book",
+            author=cls.author,
+            summary="Test summary",
+            isbn="1234567890123",
+        )
+        cls.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        cls.book_instance = BookInstance.objects.create(
+            book=cls.book,
+            imprint="Test Publisher",
+            status=LoanStatus.AVAILABLE,
+        )
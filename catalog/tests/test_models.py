@@ -1,10 +1,11 @@
 from datetime import date, timedelta
 import uuid
 
+from django.db.models import Prefetch
 from django.test import TestCase
 from django.contrib.auth.models import User
 
-from catalog.models import Author, Book, BookInstance, Genre
+from catalog.models import Author, Book, BookInstance, Genre, uuid7
 from catalog.constants import LoanStatus
 
 
@@ -124,6 +125,23 @@ class BookModelTest(TestCase):
         displayed_genres = self.book.display_genre().split(", ")
         self.assertEqual(len(displayed_genres), 3)
 
+    def test_display_genre_uses_prefetched_genres(self):
+        book = Book.objects.prefetch_related(
+            Prefetch("genre", to_attr="_prefetched_genres")
+        ).get(pk=self.book.pk)
+
+        # Should not hit the database again
+        with self.assertNumQueries(0):
+            displayed_genres = book.display_genre().split(", ")
+        self.assertCountEqual(displayed_genres, ["Fantasy", "Young Adult"])
+
+    def test_display_genre_cached_is_computed_once(self):
+        book = Book.objects.get(pk=self.book.pk)
+        self.assertEqual(book.display_genre_cached, "Fantasy, Young Adult")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(book.display_genre_cached, "Fantasy, Young Adult")
+
     def test_author_foreign_key(self):
         self.assertEqual(self.book.author, self.author)
 
@@ -176,6 +194,11 @@ class BookInstanceModelTest(TestCase):
     def test_id_is_uuid(self):
         self.assertIsInstance(self.book_instance.id, uuid.UUID)
 
+    def test_id_is_time_ordered_uuid7(self):
+        self.assertEqual(self.book_instance.id.version, 7)
+        # The leading 48 bits are a millisecond timestamp
+        self.assertLessEqual(self.book_instance.id.bytes[:6], uuid7().bytes[:6])
+
     def test_imprint_label(self):
         field_label = self.book_instance._meta.get_field("imprint").verbose_name
         self.assertEqual(field_label, "imprint")
@@ -220,12 +243,37 @@ class BookInstanceModelTest(TestCase):
         # This instance has no due_back date
         self.assertFalse(self.book_instance.is_overdue)
 
+    def test_list_fields_defers_imprint(self):
+        book_instance = BookInstance.objects.list_fields().get(
+            pk=self.book_instance.pk
+        )
+        self.assertEqual(book_instance.get_deferred_fields(), {"imprint"})
+
+    def test_with_overdue_annotation_matches_is_overdue(self):
+        instances = BookInstance.objects.with_overdue()
+        for book_instance in instances:
+            self.assertEqual(
+                book_instance.overdue,
+                bool(book_instance.due_back)
+                and book_instance.due_back < date.today(),
+            )
+            self.assertEqual(book_instance.is_overdue, book_instance.overdue)
+        self.assertTrue(instances.get(pk=self.overdue_instance.pk).overdue)
+
     def test_book_foreign_key(self):
         self.assertEqual(self.book_instance.book, self.book)
 
     def test_borrower_foreign_key(self):
         self.assertEqual(self.overdue_instance.borrower, self.user)
 
+    def test_with_related_fetches_book_author_and_borrower(self):
+        with self.assertNumQueries(1):
+            book_instance = BookInstance.objects.with_related().get(
+                pk=self.overdue_instance.pk
+            )
+            self.assertEqual(book_instance.book.author, self.author)
+            self.assertEqual(book_instance.borrower, self.user)
+
     def test_borrower_can_be_null(self):
         self.assertIsNone(self.book_instance.borrower)
 
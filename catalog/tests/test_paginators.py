@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+from catalog.models import Author
+from catalog.paginators import EstimatedCountPaginator
+
+
+class FixedEstimatePaginator(EstimatedCountPaginator):
+    """Stands in for the PostgreSQL estimate on other backends."""
+
+    estimate = None
+
+    def _estimated_count(self):
+        return self.estimate
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Author.objects.bulk_create(
+            Author(first_name=f"First {i}", last_name=f"Last {i}")
+            for i in range(3)
+        )
+
+    def test_exact_count_when_no_estimate(self):
+        paginator = EstimatedCountPaginator(Author.objects.all(), 2)
+        self.assertEqual(paginator.count, 3)
+
+    def test_exact_count_for_filtered_queryset(self):
+        queryset = Author.objects.filter(first_name="First 0")
+        self.assertIsNone(
+            EstimatedCountPaginator(queryset, 2)._estimated_count()
+        )
+
+    def test_estimate_used_above_threshold(self):
+        paginator = FixedEstimatePaginator(Author.objects.all(), 2)
+        paginator.estimate = 5000
+        with self.assertNumQueries(0):
+            self.assertEqual(paginator.count, 5000)
+
+    def test_exact_count_below_threshold(self):
+        paginator = FixedEstimatePaginator(Author.objects.all(), 2)
+        paginator.estimate = 10
+        self.assertEqual(paginator.count, 3)
@@ -0,0 +1,27 @@
+import inspect
+
+from django.test import SimpleTestCase
+from django.urls import resolve
+from django.views import View
+
+from catalog import urls
+
+
+class CatalogUrlsTest(SimpleTestCase):
+    def test_callbacks_are_view_functions(self):
+        # Class-based views must be registered as as_view() results, not as
+        # the class or a bound as_view reference
+        for pattern in urls.urlpatterns:
+            with self.subTest(name=pattern.name):
+                self.assertTrue(inspect.isfunction(pattern.callback))
+                view_class = getattr(pattern.callback, "view_class", None)
+                if view_class is not None:
+                    self.assertTrue(issubclass(view_class, View))
+
+    def test_resolve_returns_the_registered_callback(self):
+        for pattern in urls.urlpatterns:
+            if pattern.pattern.converters:
+                continue
+            with self.subTest(name=pattern.name):
+                path = f"/catalog/{pattern.pattern}"
+                self.assertIs(resolve(path).func, pattern.callback)
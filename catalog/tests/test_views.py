@@ -1,57 +1,60 @@
 import datetime
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from django.contrib.auth.models import User, Permission
-from django.contrib.contenttypes.models import ContentType
+from django.contrib.auth.models import User
 
 from catalog.models import Author, Book, BookInstance, Genre
 from catalog.constants import BOOKS_PER_PAGE, LoanStatus, DEFAULT_RENEWAL_WEEKS
 from catalog.forms import RenewBookForm
+from catalog.tests._fixtures import (
+    CatalogTestCase,
+    ClearPageCacheMixin,
+    get_permission,
+)
 
+# Computed once so fixtures and assertions agree on the date
+TODAY = datetime.date.today()
 
-class IndexViewTest(TestCase):
+
+class IndexViewTest(CatalogTestCase):
     @classmethod
     def setUpTestData(cls):
-        # Create test data
-        cls.author = Author.objects.create(
-            first_name="Test", last_name="Author"
-        )
+        super().setUpTestData()
         cls.genre = Genre.objects.create(name="Fantasy")
-        cls.book = Book.objects.create(
-            title="Test Book",
-            author=cls.author,
-            summary="Test summary",
-            isbn="1234567890123",
-        )
         cls.book.genre.add(cls.genre)
 
-        # Create book instances with different statuses
-        BookInstance.objects.create(
-            book=cls.book,
-            imprint="Test Publisher",
-            status=LoanStatus.AVAILABLE.value,
-        )
+        # Add an on-loan copy next to the shared available one
         BookInstance.objects.create(
             book=cls.book,
             imprint="Test Publisher 2",
             status=LoanStatus.ON_LOAN.value,
         )
 
+        cls.url = reverse("index")
+
+    def setUp(self):
+        super().setUp()
+        # The counts are cached across requests; start every test cold
+        cache.clear()
+
     def test_view_url_exists_at_desired_location(self):
         response = self.client.get("/catalog/")
         self.assertEqual(response.status_code, 200)
 
     def test_view_url_accessible_by_name(self):
-        response = self.client.get(reverse("index"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_view_uses_correct_template(self):
-        response = self.client.get(reverse("index"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "index.html")
 
     def test_context_contains_counts(self):
-        response = self.client.get(reverse("index"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
         # Check that context contains the expected counts
@@ -67,17 +70,43 @@ class IndexViewTest(TestCase):
         self.assertEqual(response.context["num_instances_available"], 1)
         self.assertEqual(response.context["num_authors"], 1)
 
+    def _get_catalog_queries(self):
+        """GET the page and return the queries, minus the session's."""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        return [query for query in queries if "catalog_" in query["sql"]]
+
+    def test_counts_use_three_queries(self):
+        # Books, authors, and both copy counts in a single aggregate
+        self.assertEqual(len(self._get_catalog_queries()), 3)
+
+    def test_counts_are_cached(self):
+        self.client.get(self.url)
+        self.assertEqual(self._get_catalog_queries(), [])
+
+    def test_saving_a_book_refreshes_counts(self):
+        self.client.get(self.url)
+        Book.objects.create(
+            title="Another Book",
+            author=self.author,
+            summary="Test summary",
+            isbn="1234567890124",
+        )
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.context["num_books"], 2)
+
     def test_visit_counter_increments(self):
         # First visit
-        response1 = self.client.get(reverse("index"))
+        response1 = self.client.get(self.url)
         self.assertEqual(response1.context["num_visits"], 1)
 
         # Second visit
-        response2 = self.client.get(reverse("index"))
+        response2 = self.client.get(self.url)
         self.assertEqual(response2.context["num_visits"], 2)
 
 
-class BookListViewTest(TestCase):
+class BookListViewTest(ClearPageCacheMixin, TestCase):
     @classmethod
     def setUpTestData(cls):
         cls.author = Author.objects.create(
@@ -86,36 +115,70 @@ class BookListViewTest(TestCase):
 
         # Create books for pagination test
         number_of_books = BOOKS_PER_PAGE + 2
-        for book_id in range(number_of_books):
-            Book.objects.create(
+        Book.objects.bulk_create(
+            Book(
                 title=f"Book {book_id}",
                 author=cls.author,
                 summary="Test summary",
                 isbn=f"123456789012{book_id}",
             )
+            for book_id in range(number_of_books)
+        )
+
+        cls.url = reverse("books")
 
     def test_view_url_exists_at_desired_location(self):
         response = self.client.get("/catalog/books/")
         self.assertEqual(response.status_code, 200)
 
     def test_view_url_accessible_by_name(self):
-        response = self.client.get(reverse("books"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_view_uses_correct_template(self):
-        response = self.client.get(reverse("books"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "catalog/book_list.html")
 
     def test_pagination_is_correct(self):
-        response = self.client.get(reverse("books"))
+        # A single SELECT joining the authors; keyset pages need no COUNT
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertTrue("is_paginated" in response.context)
-        self.assertTrue(response.context["is_paginated"] is True)
+        self.assertIn("next_page_query", response.context)
         self.assertTrue(len(response.context["book_list"]) == BOOKS_PER_PAGE)
 
+    def test_next_page_starts_after_cursor(self):
+        response = self.client.get(self.url)
+        first_page = response.context["book_list"]
+
+        response = self.client.get(
+            f"{self.url}?{response.context['next_page_query']}"
+        )
+        self.assertEqual(response.status_code, 200)
+        second_page = response.context["book_list"]
+
+        # The remaining books, with no repeats and no further page
+        self.assertEqual(len(second_page), 2)
+        self.assertGreater(second_page[0].title, first_page[-1].title)
+        self.assertNotIn("next_page_query", response.context)
+        self.assertFalse(response.context["is_first_page"])
+
+    def test_invalid_cursor_shows_first_page(self):
+        # "²" is a Unicode digit that int() can't parse
+        for after_id in ("y", "²"):
+            with self.subTest(after_id=after_id):
+                response = self.client.get(
+                    self.url, {"after": "x", "after_id": after_id}
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.context["book_list"][0].title, "Book 0"
+                )
+                self.assertTrue(response.context["is_first_page"])
+
     def test_books_ordered_by_title(self):
-        response = self.client.get(reverse("books"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         books = response.context["book_list"]
 
@@ -124,48 +187,27 @@ class BookListViewTest(TestCase):
             self.assertLessEqual(books[i].title, books[i + 1].title)
 
 
-class BookDetailViewTest(TestCase):
+class BookDetailViewTest(CatalogTestCase):
     @classmethod
     def setUpTestData(cls):
-        cls.author = Author.objects.create(
-            first_name="Test", last_name="Author"
-        )
-        cls.book = Book.objects.create(
-            title="Test Book",
-            author=cls.author,
-            summary="Test summary",
-            isbn="1234567890123",
-        )
-        cls.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        cls.book_instance = BookInstance.objects.create(
-            book=cls.book,
-            imprint="Test Publisher",
-            status=LoanStatus.AVAILABLE.value,
-        )
+        super().setUpTestData()
+        cls.url = reverse("book-detail", kwargs={"pk": cls.book.pk})
 
     def test_view_url_exists_at_desired_location(self):
         response = self.client.get(f"/catalog/books/{self.book.id}/")
         self.assertEqual(response.status_code, 200)
 
     def test_view_url_accessible_by_name(self):
-        response = self.client.get(
-            reverse("book-detail", kwargs={"pk": self.book.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_view_uses_correct_template(self):
-        response = self.client.get(
-            reverse("book-detail", kwargs={"pk": self.book.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "catalog/book_detail.html")
 
     def test_context_contains_loan_status_constants(self):
-        response = self.client.get(
-            reverse("book-detail", kwargs={"pk": self.book.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
         # Check that loan status constants are in context
@@ -176,9 +218,7 @@ class BookDetailViewTest(TestCase):
         self.assertIn("book_instances", response.context)
 
     def test_context_contains_book_instances(self):
-        response = self.client.get(
-            reverse("book-detail", kwargs={"pk": self.book.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
         # Check that book instances are included
@@ -186,14 +226,17 @@ class BookDetailViewTest(TestCase):
         self.assertEqual(len(book_instances), 1)
         self.assertEqual(book_instances[0], self.book_instance)
 
-    def test_404_for_invalid_book(self):
-        response = self.client.get(reverse("book-detail", kwargs={"pk": 99999}))
-        self.assertEqual(response.status_code, 404)
+    def test_related_objects_are_prefetched(self):
+        # The book with its author, then its genres and its copies
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
 
 
-class LoanedBooksByUserListViewTest(TestCase):
+class LoanedBooksByUserListViewTest(CatalogTestCase):
     @classmethod
     def setUpTestData(cls):
+        super().setUpTestData()
+
         # Create test users
         cls.user1 = User.objects.create_user(
             username="testuser1", password="testpass123"
@@ -202,50 +245,47 @@ class LoanedBooksByUserListViewTest(TestCase):
             username="testuser2", password="testpass123"
         )
 
-        # Create test data
-        cls.author = Author.objects.create(
-            first_name="Test", last_name="Author"
-        )
-        cls.book = Book.objects.create(
-            title="Test Book",
-            author=cls.author,
-            summary="Test summary",
-            isbn="1234567890123",
-        )
-
         # Create book instances for different users
-        cls.book_instance1 = BookInstance.objects.create(
-            book=cls.book,
-            imprint="Test Publisher 1",
-            status=LoanStatus.ON_LOAN.value,
-            borrower=cls.user1,
-            due_back=datetime.date.today() + datetime.timedelta(days=5),
-        )
-        cls.book_instance2 = BookInstance.objects.create(
-            book=cls.book,
-            imprint="Test Publisher 2",
-            status=LoanStatus.ON_LOAN.value,
-            borrower=cls.user2,
-            due_back=datetime.date.today() + datetime.timedelta(days=10),
+        cls.book_instance1, cls.book_instance2 = (
+            BookInstance.objects.bulk_create(
+                [
+                    BookInstance(
+                        book=cls.book,
+                        imprint="Test Publisher 1",
+                        status=LoanStatus.ON_LOAN.value,
+                        borrower=cls.user1,
+                        due_back=TODAY + datetime.timedelta(days=5),
+                    ),
+                    BookInstance(
+                        book=cls.book,
+                        imprint="Test Publisher 2",
+                        status=LoanStatus.ON_LOAN.value,
+                        borrower=cls.user2,
+                        due_back=TODAY + datetime.timedelta(days=10),
+                    ),
+                ]
+            )
         )
 
+        cls.url = reverse("my-borrowed")
+
     def test_redirect_if_not_logged_in(self):
-        response = self.client.get(reverse("my-borrowed"))
+        response = self.client.get(self.url)
         self.assertRedirects(
             response, "/accounts/login/?next=/catalog/mybooks/"
         )
 
     def test_logged_in_uses_correct_template(self):
-        self.client.login(username="testuser1", password="testpass123")
-        response = self.client.get(reverse("my-borrowed"))
+        self.client.force_login(self.user1)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(
             response, "catalog/bookinstance_list_borrowed_user.html"
         )
 
     def test_only_borrowed_books_in_list(self):
-        self.client.login(username="testuser1", password="testpass123")
-        response = self.client.get(reverse("my-borrowed"))
+        self.client.force_login(self.user1)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
         # Check that only user1's borrowed books are shown
@@ -253,6 +293,32 @@ class LoanedBooksByUserListViewTest(TestCase):
         self.assertEqual(len(bookinstance_list), 1)
         self.assertEqual(bookinstance_list[0], self.book_instance1)
 
+    def test_borrowed_books_have_book_loaded(self):
+        self.client.force_login(self.user1)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        # The book is joined in, so rendering it needs no extra query
+        bookinstance = response.context["bookinstance_list"][0]
+        with self.assertNumQueries(0):
+            self.assertEqual(bookinstance.book.title, self.book.title)
+
+    def test_query_count_does_not_grow_with_loans(self):
+        BookInstance.objects.create(
+            book=self.book,
+            imprint="Test Publisher 3",
+            status=LoanStatus.ON_LOAN,
+            borrower=self.user1,
+            due_back=TODAY + datetime.timedelta(days=1),
+        )
+        self.client.force_login(self.user1)
+
+        # The session and user, the page COUNT, the loans joined with their
+        # books, then the user's and group permissions for can_renew
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.context["bookinstance_list"]), 2)
+
     def test_books_ordered_by_due_date(self):
         # Create another book for user1
         book_instance3 = BookInstance.objects.create(
@@ -260,11 +326,11 @@ class LoanedBooksByUserListViewTest(TestCase):
             imprint="Test Publisher 3",
             status=LoanStatus.ON_LOAN.value,
             borrower=self.user1,
-            due_back=datetime.date.today() + datetime.timedelta(days=2),
+            due_back=TODAY + datetime.timedelta(days=2),
         )
 
-        self.client.login(username="testuser1", password="testpass123")
-        response = self.client.get(reverse("my-borrowed"))
+        self.client.force_login(self.user1)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
         bookinstance_list = response.context["bookinstance_list"]
@@ -274,89 +340,88 @@ class LoanedBooksByUserListViewTest(TestCase):
         self.assertEqual(bookinstance_list[1], self.book_instance1)
 
 
-class RenewBookLibrarianViewTest(TestCase):
+class MarkBookAsReturnedViewTest(CatalogTestCase):
     @classmethod
     def setUpTestData(cls):
-        # Create a user with permissions
-        cls.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
+        super().setUpTestData()
 
-        # Add the renewal permission
-        content_type = ContentType.objects.get_for_model(BookInstance)
-        permission = Permission.objects.get(
-            codename="can_renew",
-            content_type=content_type,
+        # Add the mark returned permission
+        cls.user.user_permissions.add(
+            get_permission(BookInstance, "can_mark_returned")
         )
-        cls.user.user_permissions.add(permission)
 
-        # Create test data
-        cls.author = Author.objects.create(
-            first_name="Test", last_name="Author"
+        # Lend the shared copy to the user so it can be returned
+        cls.book_instance.status = LoanStatus.ON_LOAN
+        cls.book_instance.borrower = cls.user
+        cls.book_instance.save()
+
+        cls.url = reverse("mark-returned", kwargs={"pk": cls.book_instance.pk})
+
+    def test_return_redirects_to_book_detail(self):
+        self.client.force_login(self.user)
+        response = self.client.post(self.url)
+        self.assertRedirects(
+            response, reverse("book-detail", kwargs={"pk": self.book.pk})
         )
-        cls.book = Book.objects.create(
-            title="Test Book",
-            author=cls.author,
-            summary="Test summary",
-            isbn="1234567890123",
+
+    def test_return_makes_copy_available(self):
+        self.client.force_login(self.user)
+        self.client.post(self.url)
+
+        self.book_instance.refresh_from_db()
+        self.assertEqual(self.book_instance.status, LoanStatus.AVAILABLE)
+        self.assertIsNone(self.book_instance.borrower)
+
+
+class RenewBookLibrarianViewTest(CatalogTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        # Add the renewal permission
+        cls.user.user_permissions.add(get_permission(BookInstance, "can_renew"))
+
+        # A user without the permission, for the forbidden tests
+        cls.user_no_perm = User.objects.create_user(
+            username="noperm", password="test"
         )
-        cls.book_instance = BookInstance.objects.create(
-            book=cls.book,
-            imprint="Test Publisher",
-            status=LoanStatus.ON_LOAN.value,
-            borrower=cls.user,
-            due_back=datetime.date.today() + datetime.timedelta(days=5),
+
+        # Lend the shared copy to the user so it can be renewed
+        cls.book_instance.status = LoanStatus.ON_LOAN
+        cls.book_instance.borrower = cls.user
+        cls.book_instance.due_back = TODAY + datetime.timedelta(days=5)
+        cls.book_instance.save()
+
+        cls.url = reverse(
+            "renew-book-librarian", kwargs={"pk": cls.book_instance.pk}
         )
 
     def test_redirect_if_not_logged_in(self):
-        response = self.client.get(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            )
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
 
     def test_forbidden_if_no_permission(self):
-        user_no_perm = User.objects.create_user(
-            username="noperm", password="test"
-        )
-        self.client.login(username="noperm", password="test")
-        response = self.client.get(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            )
-        )
+        self.client.force_login(self.user_no_perm)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 403)
 
     def test_logged_in_with_permission_can_access(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            )
-        )
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_uses_correct_template(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            )
-        )
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "catalog/book_renew_librarian.html")
 
     def test_form_renewal_date_initially_has_date_three_weeks_in_future(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            )
-        )
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
-        date_3_weeks_in_future = datetime.date.today() + datetime.timedelta(
+        date_3_weeks_in_future = TODAY + datetime.timedelta(
             weeks=DEFAULT_RENEWAL_WEEKS
         )
         self.assertEqual(
@@ -365,12 +430,10 @@ class RenewBookLibrarianViewTest(TestCase):
         )
 
     def test_form_invalid_renewal_date_past(self):
-        self.client.login(username="testuser", password="testpass123")
-        date_in_past = datetime.date.today() - datetime.timedelta(weeks=1)
+        self.client.force_login(self.user)
+        date_in_past = TODAY - datetime.timedelta(weeks=1)
         response = self.client.post(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            ),
+            self.url,
             {"renewal_date": date_in_past},
         )
         self.assertEqual(response.status_code, 200)
@@ -381,12 +444,10 @@ class RenewBookLibrarianViewTest(TestCase):
         )
 
     def test_form_invalid_renewal_date_future(self):
-        self.client.login(username="testuser", password="testpass123")
-        date_in_future = datetime.date.today() + datetime.timedelta(weeks=5)
+        self.client.force_login(self.user)
+        date_in_future = TODAY + datetime.timedelta(weeks=5)
         response = self.client.post(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            ),
+            self.url,
             {"renewal_date": date_in_future},
         )
         self.assertEqual(response.status_code, 200)
@@ -398,14 +459,10 @@ class RenewBookLibrarianViewTest(TestCase):
         )
 
     def test_form_valid_renewal_date_redirects_to_book_detail(self):
-        self.client.login(username="testuser", password="testpass123")
-        valid_date_in_future = datetime.date.today() + datetime.timedelta(
-            weeks=2
-        )
+        self.client.force_login(self.user)
+        valid_date_in_future = TODAY + datetime.timedelta(weeks=2)
         response = self.client.post(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            ),
+            self.url,
             {"renewal_date": valid_date_in_future},
         )
         self.assertRedirects(
@@ -414,14 +471,10 @@ class RenewBookLibrarianViewTest(TestCase):
         )
 
     def test_form_valid_renewal_date_updates_book_instance(self):
-        self.client.login(username="testuser", password="testpass123")
-        valid_date_in_future = datetime.date.today() + datetime.timedelta(
-            weeks=2
-        )
+        self.client.force_login(self.user)
+        valid_date_in_future = TODAY + datetime.timedelta(weeks=2)
         response = self.client.post(
-            reverse(
-                "renew-book-librarian", kwargs={"pk": self.book_instance.pk}
-            ),
+            self.url,
             {"renewal_date": valid_date_in_future},
         )
 
@@ -430,7 +483,7 @@ class RenewBookLibrarianViewTest(TestCase):
         self.assertEqual(self.book_instance.due_back, valid_date_in_future)
 
     def test_404_for_invalid_book_instance(self):
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.get(
             reverse(
                 "renew-book-librarian",
@@ -440,42 +493,27 @@ class RenewBookLibrarianViewTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
-class AuthorDetailViewTest(TestCase):
+class AuthorDetailViewTest(CatalogTestCase):
     @classmethod
     def setUpTestData(cls):
-        cls.author = Author.objects.create(
-            first_name="Test",
-            last_name="Author",
-            date_of_birth=datetime.date(1990, 1, 1),
-        )
-        cls.book = Book.objects.create(
-            title="Test Book",
-            author=cls.author,
-            summary="Test summary",
-            isbn="1234567890123",
-        )
+        super().setUpTestData()
+        cls.url = reverse("author-detail", kwargs={"pk": cls.author.pk})
 
     def test_view_url_exists_at_desired_location(self):
         response = self.client.get(f"/catalog/authors/{self.author.id}/")
         self.assertEqual(response.status_code, 200)
 
     def test_view_url_accessible_by_name(self):
-        response = self.client.get(
-            reverse("author-detail", kwargs={"pk": self.author.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_view_uses_correct_template(self):
-        response = self.client.get(
-            reverse("author-detail", kwargs={"pk": self.author.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "catalog/author_detail.html")
 
     def test_context_contains_author_books(self):
-        response = self.client.get(
-            reverse("author-detail", kwargs={"pk": self.author.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
         # Check that author's books are included
@@ -483,55 +521,80 @@ class AuthorDetailViewTest(TestCase):
         self.assertEqual(len(book_set), 1)
         self.assertEqual(book_set[0], self.book)
 
-    def test_404_for_invalid_author(self):
-        response = self.client.get(
-            reverse("author-detail", kwargs={"pk": 99999})
-        )
-        self.assertEqual(response.status_code, 404)
+    def test_books_are_prefetched(self):
+        # The author, then their books
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_permission_checks_load_permissions_once(self):
+        self.client.force_login(self.user)
+        # The session and user, the author and their books, then one load
+        # each of the user's and group permissions, which ModelBackend caches
+        # on the user for the second has_perm() call
+        with self.assertNumQueries(6):
+            self.client.get(self.url)
+
 
+class _AuthorFixture(TestCase):
+    """
+    An author plus a user holding ``permission_codename`` on Author and a
+    user without it, for the author editing views.
+    """
+
+    permission_codename = None
 
-class AuthorCreateViewTest(TestCase):
     @classmethod
     def setUpTestData(cls):
+        cls.author = Author.objects.create(
+            first_name="Test",
+            last_name="Author",
+            date_of_birth=datetime.date(1990, 1, 1),
+        )
         cls.user = User.objects.create_user(
             username="testuser", password="testpass123"
         )
+        cls.user.user_permissions.add(
+            get_permission(Author, cls.permission_codename)
+        )
 
-        # Add the add_author permission
-        content_type = ContentType.objects.get_for_model(Author)
-        permission = Permission.objects.get(
-            codename="add_author",
-            content_type=content_type,
+        # A user without the permission, for the forbidden tests
+        cls.user_no_perm = User.objects.create_user(
+            username="noperm", password="test"
         )
-        cls.user.user_permissions.add(permission)
+
+
+class AuthorCreateViewTest(_AuthorFixture):
+    permission_codename = "add_author"
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("author-create")
 
     def test_redirect_if_not_logged_in(self):
-        response = self.client.get(reverse("author-create"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
 
     def test_forbidden_if_no_permission(self):
-        user_no_perm = User.objects.create_user(
-            username="noperm", password="test"
-        )
-        self.client.login(username="noperm", password="test")
-        response = self.client.get(reverse("author-create"))
+        self.client.force_login(self.user_no_perm)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 403)
 
     def test_logged_in_with_permission_can_access(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(reverse("author-create"))
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_uses_correct_template(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(reverse("author-create"))
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "catalog/author_form.html")
 
     def test_form_create_author_redirects_to_detail_view(self):
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(
-            reverse("author-create"),
+            self.url,
             {
                 "first_name": "New",
                 "last_name": "Author",
@@ -546,62 +609,38 @@ class AuthorCreateViewTest(TestCase):
         )
 
 
-class AuthorUpdateViewTest(TestCase):
+class AuthorUpdateViewTest(_AuthorFixture):
+    permission_codename = "change_author"
+
     @classmethod
     def setUpTestData(cls):
-        cls.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-
-        # Add the change_author permission
-        content_type = ContentType.objects.get_for_model(Author)
-        permission = Permission.objects.get(
-            codename="change_author",
-            content_type=content_type,
-        )
-        cls.user.user_permissions.add(permission)
-
-        cls.author = Author.objects.create(
-            first_name="Test",
-            last_name="Author",
-            date_of_birth=datetime.date(1990, 1, 1),
-        )
+        super().setUpTestData()
+        cls.url = reverse("author-update", kwargs={"pk": cls.author.pk})
 
     def test_redirect_if_not_logged_in(self):
-        response = self.client.get(
-            reverse("author-update", kwargs={"pk": self.author.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
 
     def test_forbidden_if_no_permission(self):
-        user_no_perm = User.objects.create_user(
-            username="noperm", password="test"
-        )
-        self.client.login(username="noperm", password="test")
-        response = self.client.get(
-            reverse("author-update", kwargs={"pk": self.author.pk})
-        )
+        self.client.force_login(self.user_no_perm)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 403)
 
     def test_logged_in_with_permission_can_access(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(
-            reverse("author-update", kwargs={"pk": self.author.pk})
-        )
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_uses_correct_template(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(
-            reverse("author-update", kwargs={"pk": self.author.pk})
-        )
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "catalog/author_form.html")
 
     def test_form_update_author_redirects_to_detail_view(self):
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(
-            reverse("author-update", kwargs={"pk": self.author.pk}),
+            self.url,
             {
                 "first_name": "Updated",
                 "last_name": "Author",
@@ -618,96 +657,94 @@ class AuthorUpdateViewTest(TestCase):
         self.assertEqual(self.author.first_name, "Updated")
 
 
-class AuthorDeleteViewTest(TestCase):
+class AuthorDeleteViewTest(_AuthorFixture):
+    permission_codename = "delete_author"
+
     @classmethod
     def setUpTestData(cls):
-        cls.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-
-        # Add the delete_author permission
-        content_type = ContentType.objects.get_for_model(Author)
-        permission = Permission.objects.get(
-            codename="delete_author",
-            content_type=content_type,
-        )
-        cls.user.user_permissions.add(permission)
-
-        cls.author = Author.objects.create(
-            first_name="Test",
-            last_name="Author",
-            date_of_birth=datetime.date(1990, 1, 1),
-        )
+        super().setUpTestData()
+        cls.url = reverse("author-delete", kwargs={"pk": cls.author.pk})
 
     def test_redirect_if_not_logged_in(self):
-        response = self.client.get(
-            reverse("author-delete", kwargs={"pk": self.author.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
 
     def test_forbidden_if_no_permission(self):
-        user_no_perm = User.objects.create_user(
-            username="noperm", password="test"
-        )
-        self.client.login(username="noperm", password="test")
-        response = self.client.get(
-            reverse("author-delete", kwargs={"pk": self.author.pk})
-        )
+        self.client.force_login(self.user_no_perm)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 403)
 
     def test_logged_in_with_permission_can_access(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(
-            reverse("author-delete", kwargs={"pk": self.author.pk})
-        )
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_uses_correct_template(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(
-            reverse("author-delete", kwargs={"pk": self.author.pk})
-        )
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "catalog/author_confirm_delete.html")
 
     def test_form_delete_author_redirects_to_list_view(self):
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.post(
-            reverse("author-delete", kwargs={"pk": self.author.pk})
-        )
+        self.client.force_login(self.user)
+        response = self.client.post(self.url)
 
         self.assertRedirects(response, reverse("authors"))
 
         # Check that the author was deleted
         self.assertFalse(Author.objects.filter(pk=self.author.pk).exists())
 
+    def test_delete_does_not_load_the_authors_books(self):
+        Book.objects.bulk_create(
+            Book(
+                title=f"Book {book_id}",
+                author=self.author,
+                summary="Test summary",
+                isbn=f"123456789012{book_id}",
+            )
+            for book_id in range(3)
+        )
+        self.client.force_login(self.user)
+
+        # The session, the user and their permissions, the author, then one
+        # UPDATE nulling the books' author and one DELETE
+        with self.assertNumQueries(7):
+            self.client.post(self.url)
+        self.assertEqual(Book.objects.filter(author__isnull=True).count(), 3)
 
-class AuthorListViewTest(TestCase):
+
+class AuthorListViewTest(ClearPageCacheMixin, TestCase):
     @classmethod
     def setUpTestData(cls):
         # Create authors for pagination tests (BOOKS_PER_PAGE + 3 = 8 total)
         number_of_authors = BOOKS_PER_PAGE + 3
-        for author_id in range(number_of_authors):
-            Author.objects.create(
+        Author.objects.bulk_create(
+            Author(
                 first_name=f"Christian {author_id}",
                 last_name=f"Surname {author_id}",
             )
+            for author_id in range(number_of_authors)
+        )
+
+        cls.url = reverse("authors")
 
     def test_view_url_exists_at_desired_location(self):
         response = self.client.get("/catalog/authors/")
         self.assertEqual(response.status_code, 200)
 
     def test_view_url_accessible_by_name(self):
-        response = self.client.get(reverse("authors"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
     def test_view_uses_correct_template(self):
-        response = self.client.get(reverse("authors"))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "catalog/author_list.html")
 
     def test_pagination_items_per_page(self):
-        response = self.client.get(reverse("authors"))
+        # One COUNT for the paginator, one SELECT for the page
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTrue("is_paginated" in response.context)
         self.assertTrue(response.context["is_paginated"] is True)
@@ -715,8 +752,69 @@ class AuthorListViewTest(TestCase):
 
     def test_lists_all_authors(self):
         # Get second page and confirm it has (exactly) remaining 3 items
-        response = self.client.get(reverse("authors") + "?page=2")
+        response = self.client.get(self.url + "?page=2")
         self.assertEqual(response.status_code, 200)
         self.assertTrue("is_paginated" in response.context)
         self.assertTrue(response.context["is_paginated"] is True)
         self.assertTrue(len(response.context["author_list"]) == 3)
+
+
+class PageCacheTest(CatalogTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("authors")
+
+    def test_repeat_request_is_served_from_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_saving_an_author_clears_cached_pages(self):
+        self.client.get(self.url)
+        self.author.last_name = "Renamed"
+        self.author.save()
+
+        response = self.client.get(self.url)
+        self.assertContains(response, "Renamed")
+
+    def test_pages_vary_on_cookie(self):
+        response = self.client.get(self.url)
+        self.assertIn("Cookie", response["Vary"])
+
+    def test_clients_do_not_keep_cached_pages(self):
+        # Only the server cache may hold a page; clients always revalidate
+        for _ in range(2):
+            response = self.client.get(self.url)
+            self.assertIn("private", response["Cache-Control"])
+            self.assertIn("max-age=0", response["Cache-Control"])
+
+    def test_detail_pages_are_not_cached(self):
+        # They show loan state and permission-gated actions
+        for url in (
+            reverse("book-detail", kwargs={"pk": self.book.pk}),
+            reverse("author-detail", kwargs={"pk": self.author.pk}),
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertFalse(response.has_header("Expires"))
+
+
+class Catalog404Tests(SimpleTestCase):
+    """
+    Detail pages for rows that don't exist. The lookups only read, so no
+    fixtures or per-test transaction are needed.
+    """
+
+    databases = {"default"}
+
+    def test_404_for_invalid_book(self):
+        response = self.client.get(reverse("book-detail", kwargs={"pk": 99999}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_404_for_invalid_author(self):
+        response = self.client.get(
+            reverse("author-detail", kwargs={"pk": 99999})
+        )
+        self.assertEqual(response.status_code, 404)
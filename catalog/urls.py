@@ -8,9 +8,6 @@ urlpatterns = [
     path("", views.index, name="index"),
     path("books/", views.BookListView.as_view(), name="books"),
     path("books/<int:pk>/", views.BookDetailView.as_view(), name="book-detail"),
-]
-
-urlpatterns += [
     path(
         "mybooks/",
         views.LoanedBooksByUserListView.as_view(),
@@ -21,17 +18,11 @@ urlpatterns += [
         views.MarkBookAsReturnedView.as_view(),
         name="mark-returned",
     ),
-]
-
-urlpatterns += [
     path(
         "books/<uuid:pk>/renew/",
         views.renew_book_librarian,
         name="renew-book-librarian",
     ),
-]
-
-urlpatterns += [
     path("authors/", views.AuthorListView.as_view(), name="authors"),
     path(
         "authors/<int:pk>/",
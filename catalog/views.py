@@ -1,7 +1,8 @@
 """catalog/views.py"""
 
 import datetime
-from urllib import request
+from functools import wraps
+from urllib.parse import urlencode
 
 from django.shortcuts import redirect, render, get_object_or_404
 from django.contrib.auth.mixins import (
@@ -9,29 +10,87 @@ from django.contrib.auth.mixins import (
     LoginRequiredMixin,
 )
 from django.contrib.auth.decorators import permission_required, login_required
+from django.core.cache import cache
+from django.db.models import Count, Prefetch, Q
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
 from django.views import generic, View
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 from django.views.generic.edit import CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
 
 from catalog.models import Book, Author, BookInstance
-from catalog.constants import LoanStatus, BOOKS_PER_PAGE, DEFAULT_RENEWAL_WEEKS
+from catalog.constants import (
+    LoanStatus,
+    BOOKS_PER_PAGE,
+    DEFAULT_RENEWAL_WEEKS,
+    INDEX_COUNTS_CACHE_KEY,
+    INDEX_COUNTS_CACHE_TIMEOUT,
+    PAGE_CACHE_ALIAS,
+    PAGE_CACHE_TIMEOUT,
+)
 from catalog.forms import RenewBookForm
+from catalog.paginators import EstimatedCountPaginator
 
 
-def index(request):
-    """View function for home page of site."""
+def _private_to_clients(view_func):
+    """
+    Mark the view's responses private with max-age=0, so browsers and
+    proxies don't keep a copy of a page cached on the server.
 
-    # Generate counts of some of the main objects
-    num_books = Book.objects.count()
-    num_instances = BookInstance.objects.count()
+    cache_page stores a template response once it is rendered, and skips
+    responses that are already private, so the header is added by a
+    post-render callback registered after the cache's own.
+    """
+
+    @wraps(view_func)
+    def _wrapper(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        response.add_post_render_callback(
+            lambda r: patch_cache_control(r, private=True, max_age=0)
+        )
+        return response
 
-    # Available books (status = 'a')
-    num_instances_available = BookInstance.objects.filter(
-        status__exact=LoanStatus.AVAILABLE.value
-    ).count()
+    return _wrapper
 
-    # Count of all authors
-    num_authors = Author.objects.count()
+
+# Serve the read-only catalog lists from the page cache. The pages show the
+# logged in user, so they are cached per cookie, and only on the server.
+_cache_catalog_page = [
+    _private_to_clients,
+    cache_page(PAGE_CACHE_TIMEOUT, cache=PAGE_CACHE_ALIAS),
+    vary_on_cookie,
+]
+
+
+def _compute_catalog_counts():
+    """Return the book, copy and author counts shown on the home page."""
+
+    # All copies and the available ones (status = 'a') in one query
+    instance_counts = BookInstance.objects.aggregate(
+        total=Count("id"),
+        available=Count("id", filter=Q(status=LoanStatus.AVAILABLE)),
+    )
+
+    return {
+        "num_books": Book.objects.count(),
+        "num_instances": instance_counts["total"],
+        "num_instances_available": instance_counts["available"],
+        "num_authors": Author.objects.count(),
+    }
+
+
+def index(request):
+    """View function for home page of site."""
+
+    # Generate counts of some of the main objects, reusing them for a short
+    # while; saving or deleting a counted row drops the cached copy
+    counts = cache.get_or_set(
+        INDEX_COUNTS_CACHE_KEY,
+        _compute_catalog_counts,
+        INDEX_COUNTS_CACHE_TIMEOUT,
+    )
 
     # Get the current numb of visits from the session (default 1 if not set),
     # then increment and save it back to track
@@ -40,10 +99,7 @@ def index(request):
     request.session["num_visits"] = num_visits + 1
 
     context = {
-        "num_books": num_books,
-        "num_instances": num_instances,
-        "num_instances_available": num_instances_available,
-        "num_authors": num_authors,
+        **counts,
         "num_visits": num_visits,
     }
 
@@ -51,16 +107,66 @@ def index(request):
     return render(request, "index.html", context=context)
 
 
+@method_decorator(_cache_catalog_page, name="dispatch")
 class BookListView(generic.ListView):
-    """Generic class-based view for a list of books."""
+    """
+    Generic class-based view for a list of books.
+
+    Pages by keyset rather than OFFSET: the "next" link carries the title
+    and id of the last book shown, and the following page starts after it.
+    """
 
     model = Book
-    paginate_by = BOOKS_PER_PAGE
     # your own name for the list as a template variable
     context_object_name = "book_list"
     # Specify your own template name/location
     template_name = "catalog/book_list.html"
-    queryset = Book.objects.all().order_by("title")
+    page_size = BOOKS_PER_PAGE
+
+    def get_queryset(self):
+        """Return one row more than a page, starting after the cursor."""
+        # The template prints each book's author
+        queryset = (
+            Book.objects.select_related("author")
+            .only("id", "title", "author__first_name", "author__last_name")
+            .order_by("title", "id")
+        )
+        after_title = self.request.GET.get("after")
+        # A malformed cursor is ignored and the first page is shown.
+        # str.isdigit() would also accept digits such as "²" that int()
+        # rejects, so the id is parsed directly.
+        try:
+            after_id = int(self.request.GET.get("after_id", ""))
+        except ValueError:
+            after_id = None
+        self.cursor_applied = after_title is not None and after_id is not None
+        if self.cursor_applied:
+            queryset = queryset.filter(
+                Q(title__gt=after_title) | Q(title=after_title, id__gt=after_id)
+            )
+        return queryset[: self.page_size + 1]
+
+    def get_context_data(self, **kwargs):
+        """Trim the extra row and build the next page's cursor from it."""
+        books = list(self.object_list)
+        self.object_list = books[: self.page_size]
+        context = super().get_context_data(**kwargs)
+        context["is_first_page"] = not self.cursor_applied
+        if len(books) > self.page_size:
+            last = self.object_list[-1]
+            context["next_page_query"] = urlencode(
+                {"after": last.title, "after_id": last.id}
+            )
+        return context
+
+
+# Loan statuses the book detail template compares copies against
+_LOAN_STATUS_CONTEXT = {
+    "AVAILABLE": LoanStatus.AVAILABLE,
+    "ON_LOAN": LoanStatus.ON_LOAN,
+    "RESERVED": LoanStatus.RESERVED,
+    "MAINTENANCE": LoanStatus.MAINTENANCE,
+}
 
 
 class BookDetailView(generic.DetailView):
@@ -68,27 +174,25 @@ class BookDetailView(generic.DetailView):
 
     model = Book
 
+    def get_queryset(self):
+        """Load the author, genres and copies the template renders."""
+        return (
+            super()
+            .get_queryset()
+            .select_related("author")
+            .prefetch_related("genre", "bookinstance_set")
+        )
+
     def get_context_data(self, **kwargs):
         """Add additional context data to the view."""
         context = super(BookDetailView, self).get_context_data(**kwargs)
-        context["AVAILABLE"] = LoanStatus.AVAILABLE.value
-        context["ON_LOAN"] = LoanStatus.ON_LOAN.value
-        context["RESERVED"] = LoanStatus.RESERVED.value
-        context["MAINTENANCE"] = LoanStatus.MAINTENANCE.value
+        context.update(_LOAN_STATUS_CONTEXT)
         context["book_instances"] = self.object.bookinstance_set.all()
         context["can_mark_returned"] = self.request.user.has_perm(
             "catalog.can_mark_returned"
         )
         return context
 
-    def book_detali_view(self, primary_key):
-        """View function for displaying a book detail page."""
-        book = get_object_or_404(Book, pk=primary_key)
-
-        return render(
-            request, "catalog/book_detail.html", context={"book": book}
-        )
-
 
 class LoanedBooksByUserListView(LoginRequiredMixin, generic.ListView):
     """
@@ -102,8 +206,12 @@ class LoanedBooksByUserListView(LoginRequiredMixin, generic.ListView):
     def get_queryset(self):
         """Return the books on loan to the current user."""
         return (
-            BookInstance.objects.filter(borrower=self.request.user)
-            .filter(status__exact=LoanStatus.ON_LOAN.value)
+            BookInstance.objects.filter(
+                borrower=self.request.user, status__exact=LoanStatus.ON_LOAN
+            )
+            .list_fields()
+            .select_related("book")
+            .with_overdue()
             .order_by("due_back")
         )
 
@@ -121,7 +229,9 @@ class MarkBookAsReturnedView(PermissionRequiredMixin, View):
 
     def get(self, request, *args, **kwargs):
         """Display confirmation page."""
-        book_instance = get_object_or_404(BookInstance, pk=kwargs["pk"])
+        book_instance = get_object_or_404(
+            BookInstance.objects.with_related(), pk=kwargs["pk"]
+        )
         return render(
             request,
             "catalog/bookinstance_mark_as_returned.html",
@@ -133,26 +243,28 @@ class MarkBookAsReturnedView(PermissionRequiredMixin, View):
     def post(self, request, *args, **kwargs):
         """Process the form submission (confirm return)."""
         book_instance = get_object_or_404(BookInstance, pk=kwargs["pk"])
-        book_instance.status = LoanStatus.AVAILABLE.value
+        book_instance.status = LoanStatus.AVAILABLE
         book_instance.borrower = None
-        book_instance.save()
+        book_instance.save(update_fields=["status", "borrower"])
 
         # Redirect to the book detail page after returning
-        return redirect("book-detail", pk=book_instance.book.pk)
+        return redirect("book-detail", pk=book_instance.book_id)
 
 
 @login_required
 @permission_required("catalog.can_renew", raise_exception=True)
 def renew_book_librarian(request, pk):
     """View function for renewing a book instance by a librarian."""
-    book_instance = get_object_or_404(BookInstance, pk=pk)
+    book_instance = get_object_or_404(
+        BookInstance.objects.with_related(), pk=pk
+    )
 
     if request.method == "POST":
         form = RenewBookForm(request.POST)
         if form.is_valid():
             # Process the renewal
             book_instance.due_back = form.cleaned_data["renewal_date"]
-            book_instance.save()
+            book_instance.save(update_fields=["due_back"])
             return redirect("my-borrowed")
     else:
         # Display the form with the current due date
@@ -173,14 +285,19 @@ def renew_book_librarian(request, pk):
     )
 
 
+@method_decorator(_cache_catalog_page, name="dispatch")
 class AuthorListView(generic.ListView):
     """Generic class-based view for a list of authors."""
 
     model = Author
     paginate_by = BOOKS_PER_PAGE
+    paginator_class = EstimatedCountPaginator
     context_object_name = "author_list"
     template_name = "catalog/author_list.html"
-    queryset = Author.objects.all().order_by("last_name", "first_name")
+    # The template lists only the name and links to the detail page
+    queryset = Author.objects.only("id", "first_name", "last_name").order_by(
+        "last_name", "first_name"
+    )
 
     def get_context_data(self, **kwargs):
         """Add additional context data to the view."""
@@ -196,12 +313,22 @@ class AuthorDetailView(generic.DetailView):
 
     model = Author
 
+    def get_queryset(self):
+        """Prefetch the author's books, sorted, with just what is listed."""
+        # author is kept so the prefetch can match books to their author
+        books = Book.objects.only("id", "title", "author").order_by("title")
+        return (
+            super()
+            .get_queryset()
+            .prefetch_related(
+                Prefetch("book_set", queryset=books, to_attr="books_sorted")
+            )
+        )
+
     def get_context_data(self, **kwargs):
         """Add additional context data to the view."""
         context = super(AuthorDetailView, self).get_context_data(**kwargs)
-        context["book_set"] = Book.objects.filter(author=self.object).order_by(
-            "title"
-        )
+        context["book_set"] = self.object.books_sorted
         context["can_update_author"] = self.request.user.has_perm(
             "catalog.change_author"
         )
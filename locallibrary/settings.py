@@ -39,6 +39,7 @@ IS_HEROKU_APP = "DYNO" in os.environ and "CI" not in os.environ
 if IS_HEROKU_APP:
     ALLOWED_HOSTS = ["*"]
     SECURE_SSL_REDIRECT = True
+    SESSION_COOKIE_SECURE = True
 else:
     ALLOWED_HOSTS = [
         ".localhost",
@@ -59,7 +60,6 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "catalog.apps.CatalogConfig",
-    "django_seed",  # Django Seed for seeding data
 ]
 
 MIDDLEWARE = [
@@ -123,6 +123,22 @@ else:
     }
 
 
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Rendered catalog pages get their own cache so saving a catalog object can
+# clear them without touching anything else
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "pages": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "pages",
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,42 @@
+"""
+Django settings for running the locallibrary test suite.
+
+Usage:
+    python manage.py test --settings=locallibrary.settings_test
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# In-memory SQLite: no server needed, no disk I/O or fsync during tests
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"NAME": ":memory:"},
+    }
+}
+
+# The manifest storage requires collectstatic to have been run
+STORAGES = {
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    }
+}
+
+# Fast (insecure) hashing: create_user() and login() skip PBKDF2
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+class DisableMigrations:
+    """Build the test schema straight from the models, skipping migrations."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+# The only data step (0008) trims existing summaries, which a fresh test
+# database doesn't have, so nothing is lost by skipping migrations
+MIGRATION_MODULES = DisableMigrations()